@@ -3,6 +3,7 @@
 OpenAPI Specification Server Runner
 """
 
+import argparse
 import asyncio
 import sys
 import logging
@@ -11,10 +12,13 @@ from pathlib import Path
 # Add src to Python path if needed
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
-from spec_server import app
-import uvicorn
+from spec_server import app, run_server
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the OpenAPI Specification Server")
+    parser.add_argument("--dev", action="store_true", help="Enable auto-reload and access logging for local development")
+    args = parser.parse_args()
+
     logging.basicConfig(level=logging.INFO)
 
     print("Starting OpenAPI Specification Server...")
@@ -26,10 +30,4 @@ if __name__ == "__main__":
     print("  - Spec Info: http://localhost:8001/{spec_name}/info")
     print("\nPress Ctrl+C to stop the server")
 
-    uvicorn.run(
-        "spec_server:app",
-        host="0.0.0.0",
-        port=8001,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    run_server(args.dev)
\ No newline at end of file
@@ -4,16 +4,34 @@ Simple HTTP server to serve OpenAPI specifications
 """
 
 import os
+import re
+import asyncio
+import gzip
+import mmap
+import argparse
+import hashlib
 import logging
-import json
+import orjson
 import yaml
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, NamedTuple, Optional, Union
 
 import uvicorn
-from fastapi import FastAPI, HTTPException, Response
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, PlainTextResponse
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Prefer the libyaml-backed loader/dumper, falling back to pure Python if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+# Brotli is optional; without it responses are only precompressed with gzip
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -25,23 +43,177 @@ app = FastAPI(
     version="1.0.0"
 )
 
+class CORSASGIMiddleware:
+    """Pure ASGI CORS middleware allowing any origin, method and header with credentials"""
+
+    allow_methods = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        # Not a cross-origin request, nothing to add
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Echo the origin rather than "*", since browsers reject a wildcard when credentials are allowed
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        # Answer preflight requests directly without dispatching to the app
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            preflight_headers = cors_headers + [
+                (b"access-control-allow-methods", self.allow_methods),
+                (b"access-control-max-age", b"600"),
+                (b"content-length", b"0"),
+            ]
+            if request_headers:
+                preflight_headers.append((b"access-control-allow-headers", request_headers))
+
+            await send({"type": "http.response.start", "status": 204, "headers": preflight_headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(CORSASGIMiddleware)
+
+# HTTP methods whose operations contribute capabilities
+HTTP_METHODS = frozenset({'get', 'post', 'put', 'delete', 'patch'})
+
+# Common words that are never useful as capabilities
+CAPABILITY_STOP_WORDS = frozenset({'get', 'post', 'put', 'delete', 'patch', 'the', 'and', 'for', 'with', 'from', 'this', 'that', 'are', 'you', 'all', 'can', 'will', 'one', 'use'})
+
+# Common words that are never useful as tags
+TAG_STOP_WORDS = frozenset({'api', 'the', 'and', 'for', 'with', 'from', 'this', 'that', 'are', 'you', 'all', 'can', 'will', 'one', 'use', 'get', 'via', 'about', 'information', 'data', 'service', 'services'})
+
+# Words of at least 4 characters starting with a letter; punctuation never ends up in a match
+TAG_WORD_PATTERN = re.compile(r"[^\W\d_][^\W_]{3,}")
+
+# HTML tags embedded in descriptions (e.g. <font color='...'>), removed before tokenizing
+HTML_TAG_PATTERN = re.compile(r"<[^>]*>")
 
 # Get the project root directory
 PROJECT_ROOT = Path(__file__).parent
 SPECS_DIR = PROJECT_ROOT / "specs"
 
-# Global variable to store discovered specs
-discovered_specs: Dict[str, Path] = {}
+class SpecMeta(NamedTuple):
+    """File metadata for a discovered spec, captured once so requests never touch pathlib or stat()"""
+    path_str: str
+    suffix: str  # lowercased
+    format: str  # "json" or "yaml"
+    name: str
+    stat_result: os.stat_result
+
+class LoadedSpec(NamedTuple):
+    """Everything derived from a spec file at startup; each derived result is None if its own step failed"""
+    file_bytes: bytes
+    file_etag: str
+    file_variants: Dict[str, bytes]
+    spec_data: Optional[Dict[str, Any]] = None
+    tags: Optional[List[str]] = None
+    capabilities: Optional[List[str]] = None
+    info_bytes: Optional[bytes] = None
+    converted_bytes: Optional[bytes] = None
+    converted_etag: Optional[str] = None
+    converted_variants: Optional[Dict[str, bytes]] = None
 
-def discover_specs() -> Dict[str, Path]:
+# Global variable to store discovered specs
+discovered_specs: Dict[str, SpecMeta] = {}
+
+# Parsed spec data and derived metadata, loaded once at startup
+parsed_specs: Dict[str, Dict[str, Any]] = {}
+spec_tags: Dict[str, List[str]] = {}
+spec_capabilities: Dict[str, List[str]] = {}
+spec_info_bytes: Dict[str, bytes] = {}
+
+# Converted spec bytes and their ETags, keyed by spec name. Only the format that
+# differs from the source file (YAML for JSON specs, JSON for YAML specs) is stored;
+# the original file is served as-is.
+spec_converted_bytes: Dict[str, bytes] = {}
+spec_etags: Dict[str, str] = {}
+
+# Original spec file bytes and their ETags, read once at startup so the body always
+# matches the ETag and precompressed variants even if the file changes on disk
+spec_file_bytes: Dict[str, bytes] = {}
+spec_file_etags: Dict[str, str] = {}
+
+# Endpoint URLs for each spec, built once at startup
+spec_urls: Dict[str, Dict[str, str]] = {}
+
+# Serialized root collections and /specs responses, built once at startup
+root_json_bytes: bytes = b"[]"
+root_etag: str = ""
+specs_json_bytes: bytes = b"{}"
+
+# Precompressed bodies keyed by the ETag of the uncompressed content, preferred encoding first
+compressed_bodies: Dict[str, Dict[str, bytes]] = {}
+
+# Bodies smaller than this are not worth compressing
+COMPRESSION_MIN_SIZE = 500
+
+# Spec files at least this large are memory-mapped at startup instead of read into a bytes copy
+MMAP_MIN_SIZE = 64 * 1024
+
+# Pre-serialized error bodies, so these requests skip the HTTPException handling path
+NOT_FOUND_BYTES = orjson.dumps({"detail": "Specification not found"})
+INFO_UNAVAILABLE_BYTES = orjson.dumps({"detail": "Specification info is unavailable: the file could not be processed"})
+CONVERSION_UNAVAILABLE_BYTES = orjson.dumps({"detail": "Specification could not be converted to the requested format"})
+
+def load_json(content: Union[bytes, mmap.mmap]) -> Any:
+    """Parse JSON spec content"""
+    # orjson takes a memoryview but not an mmap object itself
+    with memoryview(content) as view:
+        return orjson.loads(view)
+
+def load_yaml(content: Union[bytes, mmap.mmap]) -> Any:
+    """Parse YAML spec content"""
+    # PyYAML reads an mmap as a stream
+    return yaml.load(content, Loader=SafeLoader)
+
+def dump_json(spec_data: Dict[str, Any]) -> bytes:
+    """Render a spec as indented JSON"""
+    # OPT_NON_STR_KEYS mirrors json.dumps for unquoted YAML keys such as response codes
+    return orjson.dumps(spec_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+def dump_yaml(spec_data: Dict[str, Any]) -> bytes:
+    """Render a spec as block-style YAML"""
+    return yaml.dump(spec_data, Dumper=SafeDumper, default_flow_style=False, sort_keys=False).encode('utf-8')
+
+# Format and loader for each supported spec file suffix; discovery only picks up these suffixes
+SPEC_FORMATS = {".yaml": "yaml", ".yml": "yaml", ".json": "json"}
+LOADERS = {".yaml": load_yaml, ".yml": load_yaml, ".json": load_json}
+
+# Serializer for each format, and the format each source format is converted to
+SERIALIZERS = {"json": dump_json, "yaml": dump_yaml}
+CONVERTED_FORMATS = {"json": "yaml", "yaml": "json"}
+
+def discover_specs() -> Dict[str, SpecMeta]:
     """Discover all OpenAPI specification files in the specs directory"""
     specs = {}
     if not SPECS_DIR.exists():
@@ -49,59 +221,343 @@ def discover_specs() -> Dict[str, Path]:
         return specs
 
     # Look for YAML and JSON files that appear to be OpenAPI specs
-    for pattern in ["*.yaml", "*.yml", "*.json"]:
-        for file_path in SPECS_DIR.glob(pattern):
+    for suffix in LOADERS:
+        for file_path in SPECS_DIR.glob(f"*{suffix}"):
             # Create a clean spec name from filename
             spec_name = file_path.stem.replace("-openapi", "").replace("_openapi", "").replace("openapi", "").replace("-", "_").replace(".", "_").strip("_")
             if not spec_name:
                 spec_name = file_path.stem
 
-            specs[spec_name] = file_path
+            try:
+                file_stat = file_path.stat()
+            except OSError as e:
+                logger.warning(f"Skipping unreadable spec file {file_path}: {e}")
+                continue
+
+            specs[spec_name] = SpecMeta(
+                path_str=str(file_path),
+                suffix=suffix,
+                format=SPEC_FORMATS[suffix],
+                name=file_path.name,
+                stat_result=file_stat
+            )
 
     logger.info(f"Discovered {len(specs)} specifications: {list(specs.keys())}")
     return specs
 
+def build_specifications() -> Dict[str, Any]:
+    """Build the specification listing served by the /specs endpoint"""
+    specs = []
+
+    for spec_name, spec_meta in discovered_specs.items():
+        # Files were validated and stat'ed during discovery
+        urls = spec_urls[spec_name]
+        specs.append({
+            "name": spec_name,
+            "file_name": spec_meta.name,
+            "file_type": spec_meta.suffix,
+            "yaml_url": urls["yaml_url"],
+            "json_url": urls["json_url"],
+            "download_url": urls["download_url"],
+            "info_url": urls["info_url"],
+            "file_path": spec_meta.path_str,
+            "exists": True,
+            "size_bytes": spec_meta.stat_result.st_size,
+            "modified_time": spec_meta.stat_result.st_mtime
+        })
+
+    return {
+        "specifications": specs,
+        "count": len(specs),
+        "specs_directory": str(SPECS_DIR)
+    }
+
+def make_etag(content: bytes) -> str:
+    """Build a strong ETag from the content bytes"""
+    return f'"{hashlib.sha256(content).hexdigest()}"'
+
+def not_modified_response(request: Request, etag: str) -> Optional[Response]:
+    """Return a 304 response if the client's If-None-Match header matches the ETag"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return None
+
+    client_etags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    if "*" in client_etags or etag in client_etags:
+        return Response(
+            status_code=304,
+            headers={
+                "ETag": etag,
+                "Cache-Control": "public, max-age=3600"
+            }
+        )
+
+    return None
+
+def compress_variants(content: bytes) -> Dict[str, bytes]:
+    """Precompress content with every available encoding, preferred encoding first"""
+    if len(content) < COMPRESSION_MIN_SIZE:
+        return {}
+
+    variants = {}
+    if brotli is not None:
+        variants["br"] = brotli.compress(content, quality=5)
+    # A fixed header mtime keeps the gzip bytes identical across workers and restarts
+    variants["gzip"] = gzip.compress(content, compresslevel=6, mtime=0)
+    return variants
+
+def accepted_encodings(request: Request) -> List[str]:
+    """Parse the Accept-Encoding header, skipping encodings the client refuses with q=0"""
+    encodings = []
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        encodings.append(coding.strip().lower())
+    return encodings
+
+def compressed_response(request: Request, etag: str, media_type: str, headers: Dict[str, str]) -> Optional[Response]:
+    """Serve a precompressed variant of the body identified by etag if the client accepts one"""
+    variants = compressed_bodies.get(etag)
+    if not variants:
+        return None
+
+    encodings = accepted_encodings(request)
+    for encoding, body in variants.items():
+        if encoding not in encodings:
+            continue
+
+        # Each encoding is a different representation, so it gets its own strong ETag
+        encoded_etag = f'{etag[:-1]}-{encoding}"'
+        not_modified = not_modified_response(request, encoded_etag)
+        if not_modified:
+            not_modified.headers["Vary"] = "Accept-Encoding"
+            return not_modified
+
+        return Response(
+            content=body,
+            media_type=media_type,
+            headers={
+                **headers,
+                "Cache-Control": "public, max-age=3600",
+                "ETag": encoded_etag,
+                "Content-Encoding": encoding,
+                "Vary": "Accept-Encoding"
+            }
+        )
+
+    return None
+
+def parse_spec(content: Union[bytes, mmap.mmap], spec_meta: SpecMeta) -> Dict[str, Any]:
+    """Parse the raw content of an OpenAPI specification file (JSON or YAML)"""
+    spec_data = LOADERS[spec_meta.suffix](content)
+
+    if not isinstance(spec_data, dict):
+        raise ValueError(f"Specification is not a mapping: {spec_meta.path_str}")
+
+    return spec_data
+
+def build_spec_urls(spec_name: str) -> Dict[str, str]:
+    """Build the endpoint URLs advertised for a spec"""
+    return {
+        "yaml_url": f"/{spec_name}/openapi.yaml",
+        "json_url": f"/{spec_name}/openapi.json",
+        "download_url": f"/{spec_name}/download",
+        "info_url": f"/{spec_name}/info",
+        "openapi_spec": f"http://0.0.0.0:8001/{spec_name}/openapi.json"
+    }
+
+def build_spec_info(spec_name: str, spec_meta: SpecMeta, spec_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the info payload served by the /{spec_name}/info endpoint"""
+    # Extract key information
+    info = spec_data.get('info', {})
+    paths = spec_data.get('paths', {})
+    components = spec_data.get('components', {})
+    urls = spec_urls[spec_name]
+
+    return {
+        "spec_name": spec_name,
+        "title": info.get('title', 'Unknown'),
+        "version": info.get('version', 'Unknown'),
+        "description": info.get('description', ''),
+        "endpoints": len(paths),
+        "endpoint_paths": list(paths) if len(paths) <= 50 else f"{len(paths)} endpoints (too many to list)",
+        "schemas": len(components.get('schemas', {})),
+        "security_schemes": len(components.get('securitySchemes', {})),
+        "servers": spec_data.get('servers', []),
+        "file_info": {
+            "name": spec_meta.name,
+            "path": spec_meta.path_str,
+            "type": spec_meta.suffix,
+            "size_bytes": spec_meta.stat_result.st_size,
+            "modified": spec_meta.stat_result.st_mtime
+        },
+        "urls": {
+            "yaml": urls["yaml_url"],
+            "json": urls["json_url"],
+            "download": urls["download_url"]
+        }
+    }
+
+def load_spec_file(spec_name: str, spec_meta: SpecMeta) -> Optional[LoadedSpec]:
+    """Read, parse and pre-render a single spec file. Runs in a worker thread at startup."""
+    try:
+        with open(spec_meta.path_str, 'rb') as f:
+            # Map large files so hashing, compression and parsing work on the page cache; only the
+            # bytes kept for serving are copied out
+            if spec_meta.stat_result.st_size >= MMAP_MIN_SIZE:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return derive_loaded_spec(spec_name, spec_meta, mapped)
+
+            file_content = f.read()
+    except (OSError, ValueError) as e:
+        logger.error(f"Error reading spec {spec_name}: {e}")
+        return None
+
+    return derive_loaded_spec(spec_name, spec_meta, file_content)
+
+def derive_loaded_spec(spec_name: str, spec_meta: SpecMeta, file_content: Union[bytes, mmap.mmap]) -> LoadedSpec:
+    """Build the ETag, compressed variants, parsed data and converted rendering for a spec's content"""
+    # The file bytes and ETag are kept even if parsing fails so the original file stays downloadable
+    file_bytes = bytes(file_content)
+    file_etag = make_etag(file_content)
+    file_variants = compress_variants(file_content)
+
+    try:
+        spec_data = parse_spec(file_content, spec_meta)
+    except Exception as e:
+        logger.error(f"Error loading spec {spec_name}: {e}")
+        return LoadedSpec(file_bytes, file_etag, file_variants)
+
+    # Tags and capabilities only feed the root collections, so a spec they choke on is still served
+    try:
+        tags = extract_tags_from_spec(spec_data, spec_name)
+    except Exception as e:
+        logger.error(f"Error extracting tags from spec {spec_name}: {e}")
+        tags = []
+
+    try:
+        capabilities = extract_capabilities_from_spec(spec_data)
+    except Exception as e:
+        logger.error(f"Error extracting capabilities from spec {spec_name}: {e}")
+        capabilities = []
+
+    try:
+        info_bytes = orjson.dumps(build_spec_info(spec_name, spec_meta, spec_data), option=orjson.OPT_NON_STR_KEYS)
+    except Exception as e:
+        logger.error(f"Error building info for spec {spec_name}: {e}")
+        info_bytes = None
+
+    # Pre-render the converted format so requests never parse or dump
+    try:
+        converted_bytes = SERIALIZERS[CONVERTED_FORMATS[spec_meta.format]](spec_data)
+        converted_etag = make_etag(converted_bytes)
+        converted_variants = compress_variants(converted_bytes)
+    except Exception as e:
+        logger.error(f"Error converting spec {spec_name}: {e}")
+        converted_bytes = converted_etag = converted_variants = None
+
+    return LoadedSpec(
+        file_bytes,
+        file_etag,
+        file_variants,
+        spec_data,
+        tags,
+        capabilities,
+        info_bytes,
+        converted_bytes,
+        converted_etag,
+        converted_variants
+    )
+
+async def load_specs(specs: Dict[str, SpecMeta]) -> None:
+    """Parse every discovered specification once, in parallel, and cache everything derived from it"""
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*[
+        loop.run_in_executor(None, load_spec_file, spec_name, spec_meta)
+        for spec_name, spec_meta in specs.items()
+    ])
+
+    parsed_specs.clear()
+    spec_tags.clear()
+    spec_capabilities.clear()
+    spec_info_bytes.clear()
+    spec_converted_bytes.clear()
+    spec_etags.clear()
+    spec_file_bytes.clear()
+    spec_file_etags.clear()
+    compressed_bodies.clear()
+
+    for spec_name, loaded in zip(specs, results):
+        if loaded is None:
+            continue
+
+        spec_file_bytes[spec_name] = loaded.file_bytes
+        spec_file_etags[spec_name] = loaded.file_etag
+        compressed_bodies[loaded.file_etag] = loaded.file_variants
+
+        if loaded.spec_data is None:
+            continue
+
+        parsed_specs[spec_name] = loaded.spec_data
+        spec_tags[spec_name] = loaded.tags
+        spec_capabilities[spec_name] = loaded.capabilities
+        if loaded.info_bytes is not None:
+            spec_info_bytes[spec_name] = loaded.info_bytes
+
+        if loaded.converted_bytes is None:
+            continue
+
+        spec_converted_bytes[spec_name] = loaded.converted_bytes
+        spec_etags[spec_name] = loaded.converted_etag
+        compressed_bodies[loaded.converted_etag] = loaded.converted_variants
+
+    logger.info(f"Loaded {len(parsed_specs)} of {len(specs)} specifications")
+
 def extract_capabilities_from_spec(spec_data: Dict[str, Any]) -> List[str]:
     """Extract capabilities from OpenAPI spec paths and operations"""
     capabilities = []
     paths = spec_data.get('paths', {})
 
+    # Bind the hot list methods once for the whole loop
+    append = capabilities.append
+    extend = capabilities.extend
+
     for path, path_item in paths.items():
+        # Path segments are the same for every operation on the path, so compute them once
+        path_lower = path.lower()
+        path_segments = [seg for seg in path_lower.split('/') if seg and not seg.startswith('{') and len(seg) > 2]
+
         for method, operation in path_item.items():
-            if method.lower() in ['get', 'post', 'put', 'delete', 'patch']:
-                operation_id = operation.get('operationId', '')
-                summary = operation.get('summary', '').lower()
-                description = operation.get('description', '').lower()
-                path_lower = path.lower()
-
-                # Extract capabilities from operation IDs, summaries, and paths
-                # Use operation ID as capability if available
-                if operation_id:
-                    capabilities.append(operation_id)
-
-                # Extract meaningful words from path segments
-                path_segments = [seg for seg in path_lower.split('/') if seg and not seg.startswith('{')]
-                for segment in path_segments:
-                    if len(segment) > 2:  # Ignore very short segments
-                        capabilities.append(segment)
-
-                # Extract key words from summary (first 3 meaningful words)
-                if summary:
-                    summary_words = [word for word in summary.split() if len(word) > 3]
-                    capabilities.extend(summary_words[:3])
+            # Skip path-level keys such as parameters, servers and summary
+            if method.lower() not in HTTP_METHODS:
+                continue
+
+            operation_id = operation.get('operationId', '')
+            summary = operation.get('summary', '').lower()
+
+            # Extract capabilities from operation IDs, summaries, and paths
+            # Use operation ID as capability if available
+            if operation_id:
+                append(operation_id)
+
+            # Extract meaningful words from path segments (ignoring very short segments)
+            extend(path_segments)
+
+            # Extract key words from summary (first 3 meaningful words)
+            if summary:
+                extend([word for word in summary.split() if len(word) > 3][:3])
 
     # Remove duplicates, filter out common words, and return
-    common_words = {'get', 'post', 'put', 'delete', 'patch', 'the', 'and', 'for', 'with', 'from', 'this', 'that', 'are', 'you', 'all', 'can', 'will', 'one', 'use'}
-    filtered_capabilities = [cap for cap in set(capabilities) if cap not in common_words and len(cap) > 2]
-    return sorted(filtered_capabilities)
+    return sorted({cap for cap in capabilities if len(cap) > 2 and cap not in CAPABILITY_STOP_WORDS})
 
 def extract_tags_from_spec(spec_data: Dict[str, Any], spec_name: str) -> List[str]:
     """Extract relevant tags from OpenAPI spec"""
     tags = []
 
     # Get tags from spec
-    spec_tags = spec_data.get('tags', [])
-    for tag in spec_tags:
+    raw_tags = spec_data.get('tags', [])
+    for tag in raw_tags:
         if isinstance(tag, dict):
             tag_name = tag.get('name', '').lower()
             if tag_name:
@@ -113,38 +569,25 @@ def extract_tags_from_spec(spec_data: Dict[str, Any], spec_name: str) -> List[st
     title = spec_data.get('info', {}).get('title', '').lower()
     description = spec_data.get('info', {}).get('description', '').lower()
 
-    # Extract meaningful words from title and description
-    all_text = f"{title} {description}"
-    words = all_text.split()
-
-    # Filter out common words and extract meaningful keywords
-    common_words = {'api', 'the', 'and', 'for', 'with', 'from', 'this', 'that', 'are', 'you', 'all', 'can', 'will', 'one', 'use', 'get', 'via', 'about', 'information', 'data', 'service', 'services'}
-    meaningful_words = [word.strip('.,!?;:') for word in words if len(word) > 3 and word not in common_words]
+    # Extract meaningful words from title and description, filtering out common words;
+    # HTML markup is dropped first so its tag and attribute names never become tags
+    words = TAG_WORD_PATTERN.findall(HTML_TAG_PATTERN.sub(" ", f"{title} {description}"))
+    meaningful_words = [word for word in words if word not in TAG_STOP_WORDS]
 
     # Take the first 5 meaningful words as tags
     tags.extend(meaningful_words[:5])
 
-    # Remove duplicates and return
-    return list(set(tags))
+    # Remove duplicates and return in a stable order so the root ETag matches across processes
+    return sorted(set(tags))
 
-@app.get("/")
-async def root():
-    """Root endpoint with OpenAPI collections in structured format"""
+def build_collections() -> List[Dict[str, Any]]:
+    """Build the OpenAPI collections structure served by the root endpoint"""
     collections = []
 
-    for spec_name, spec_path in discovered_specs.items():
+    for spec_name in discovered_specs:
         try:
-            if not spec_path.exists():
-                continue
-
-            # Load the spec data
-            with open(spec_path, 'r', encoding='utf-8') as f:
-                if spec_path.suffix.lower() == '.json':
-                    spec_data = json.load(f)
-                elif spec_path.suffix.lower() in ['.yaml', '.yml']:
-                    spec_data = yaml.safe_load(f)
-                else:
-                    continue
+            # Use the spec data parsed at startup
+            spec_data = parsed_specs[spec_name]
 
             info = spec_data.get('info', {})
             servers = spec_data.get('servers', [])
@@ -157,10 +600,10 @@ async def root():
             # Create the collection structure
             collection = {
                 "name": info.get('title', spec_name.replace('_', ' ').title()),
-                "tags": extract_tags_from_spec(spec_data, spec_name),
+                "tags": spec_tags[spec_name],
                 "description": info.get('description', f"{spec_name.title()} API").strip(),
-                "openapi_spec": f"http://0.0.0.0:8001/{spec_name}/openapi.json",
-                "capabilities": extract_capabilities_from_spec(spec_data),
+                "openapi_spec": spec_urls[spec_name]["openapi_spec"],
+                "capabilities": spec_capabilities[spec_name],
                 "base_url": base_url
             }
 
@@ -173,88 +616,103 @@ async def root():
                 "name": spec_name.replace('_', ' ').title(),
                 "tags": [],
                 "description": f"{spec_name.title()} API",
-                "openapi_spec": f"http://0.0.0.0:8001/{spec_name}/openapi.json",
+                "openapi_spec": spec_urls[spec_name]["openapi_spec"],
                 "capabilities": [],
                 "base_url": ""
             })
 
     return collections
 
+@app.get("/")
+async def root(request: Request):
+    """Root endpoint with OpenAPI collections in structured format"""
+    compressed = compressed_response(request, root_etag, "application/json", {})
+    if compressed:
+        return compressed
+
+    not_modified = not_modified_response(request, root_etag)
+    if not_modified:
+        not_modified.headers["Vary"] = "Accept-Encoding"
+        return not_modified
+
+    return Response(
+        content=root_json_bytes,
+        media_type="application/json",
+        headers={
+            "Cache-Control": "public, max-age=3600",
+            "ETag": root_etag,
+            "Vary": "Accept-Encoding"
+        }
+    )
+
 @app.get("/health")
-async def health_check():
+async def health_check() -> Dict[str, str]:
     """Health check endpoint"""
     return {"status": "healthy", "message": "OpenAPI Spec Server is running"}
 
 @app.get("/specs")
 async def list_specifications():
     """List all available OpenAPI specifications"""
-    specs = []
-
-    for spec_name, file_path in discovered_specs.items():
-        try:
-            file_stat = file_path.stat() if file_path.exists() else None
-            specs.append({
-                "name": spec_name,
-                "file_name": file_path.name,
-                "file_type": file_path.suffix,
-                "yaml_url": f"/{spec_name}/openapi.yaml",
-                "json_url": f"/{spec_name}/openapi.json",
-                "download_url": f"/{spec_name}/download",
-                "info_url": f"/{spec_name}/info",
-                "file_path": str(file_path),
-                "exists": file_path.exists(),
-                "size_bytes": file_stat.st_size if file_stat else 0,
-                "modified_time": file_stat.st_mtime if file_stat else None
-            })
-        except Exception as e:
-            logger.error(f"Error getting info for spec {spec_name}: {e}")
-            specs.append({
-                "name": spec_name,
-                "file_name": file_path.name,
-                "error": str(e)
-            })
-
-    return {
-        "specifications": specs,
-        "count": len(specs),
-        "specs_directory": str(SPECS_DIR)
-    }
+    return Response(content=specs_json_bytes, media_type="application/json")
 
 @app.get("/{spec_name}/openapi.yaml")
-async def get_spec_yaml(spec_name: str):
+async def get_spec_yaml(spec_name: str, request: Request):
     """Serve OpenAPI specification in YAML format"""
     if spec_name not in discovered_specs:
-        raise HTTPException(status_code=404, detail=f"Specification '{spec_name}' not found")
+        return Response(content=NOT_FOUND_BYTES, media_type="application/json", status_code=404)
 
-    spec_path = discovered_specs[spec_name]
-
-    if not spec_path.exists():
-        raise HTTPException(status_code=404, detail=f"Specification file not found: {spec_path}")
+    spec_meta = discovered_specs[spec_name]
 
     try:
         # If the file is already YAML, serve it directly
-        if spec_path.suffix.lower() in ['.yaml', '.yml']:
-            return FileResponse(
-                path=str(spec_path),
+        if spec_meta.format == 'yaml':
+            file_etag = spec_file_etags[spec_name]
+            compressed = compressed_response(request, file_etag, "application/x-yaml", {
+                "Content-Disposition": f"inline; filename={spec_name}-openapi.yaml"
+            })
+            if compressed:
+                return compressed
+
+            not_modified = not_modified_response(request, file_etag)
+            if not_modified:
+                not_modified.headers["Vary"] = "Accept-Encoding"
+                return not_modified
+
+            return Response(
+                content=spec_file_bytes[spec_name],
                 media_type="application/x-yaml",
                 headers={
                     "Content-Disposition": f"inline; filename={spec_name}-openapi.yaml",
-                    "Cache-Control": "public, max-age=3600"
+                    "Cache-Control": "public, max-age=3600",
+                    "ETag": file_etag,
+                    "Vary": "Accept-Encoding"
                 }
             )
         # If it's JSON, convert to YAML
-        elif spec_path.suffix.lower() == '.json':
-            with open(spec_path, 'r', encoding='utf-8') as f:
-                json_content = json.load(f)
+        else:
+            converted_etag = spec_etags.get(spec_name)
+            if converted_etag is None:
+                return Response(content=CONVERSION_UNAVAILABLE_BYTES, media_type="application/json", status_code=500)
+
+            compressed = compressed_response(request, converted_etag, "application/x-yaml", {
+                "Content-Disposition": f"inline; filename={spec_name}-openapi.yaml"
+            })
+            if compressed:
+                return compressed
 
-            yaml_content = yaml.dump(json_content, default_flow_style=False, sort_keys=False)
+            not_modified = not_modified_response(request, converted_etag)
+            if not_modified:
+                not_modified.headers["Vary"] = "Accept-Encoding"
+                return not_modified
 
             return Response(
-                content=yaml_content,
+                content=spec_converted_bytes[spec_name],
                 media_type="application/x-yaml",
                 headers={
                     "Content-Disposition": f"inline; filename={spec_name}-openapi.yaml",
-                    "Cache-Control": "public, max-age=3600"
+                    "Cache-Control": "public, max-age=3600",
+                    "ETag": converted_etag,
+                    "Vary": "Accept-Encoding"
                 }
             )
     except Exception as e:
@@ -262,40 +720,63 @@ async def get_spec_yaml(spec_name: str):
         raise HTTPException(status_code=500, detail=f"Error serving specification: {str(e)}")
 
 @app.get("/{spec_name}/openapi.json")
-async def get_spec_json(spec_name: str):
+async def get_spec_json(spec_name: str, request: Request):
     """Serve OpenAPI specification in JSON format"""
     if spec_name not in discovered_specs:
-        raise HTTPException(status_code=404, detail=f"Specification '{spec_name}' not found")
+        return Response(content=NOT_FOUND_BYTES, media_type="application/json", status_code=404)
 
-    spec_path = discovered_specs[spec_name]
-
-    if not spec_path.exists():
-        raise HTTPException(status_code=404, detail=f"Specification file not found: {spec_path}")
+    spec_meta = discovered_specs[spec_name]
 
     try:
         # If the file is JSON, serve it directly
-        if spec_path.suffix.lower() == '.json':
-            return FileResponse(
-                path=str(spec_path),
+        if spec_meta.format == 'json':
+            file_etag = spec_file_etags[spec_name]
+            compressed = compressed_response(request, file_etag, "application/json", {
+                "Content-Disposition": f"inline; filename={spec_name}-openapi.json"
+            })
+            if compressed:
+                return compressed
+
+            not_modified = not_modified_response(request, file_etag)
+            if not_modified:
+                not_modified.headers["Vary"] = "Accept-Encoding"
+                return not_modified
+
+            return Response(
+                content=spec_file_bytes[spec_name],
                 media_type="application/json",
                 headers={
                     "Content-Disposition": f"inline; filename={spec_name}-openapi.json",
-                    "Cache-Control": "public, max-age=3600"
+                    "Cache-Control": "public, max-age=3600",
+                    "ETag": file_etag,
+                    "Vary": "Accept-Encoding"
                 }
             )
         # If it's YAML, convert to JSON
-        elif spec_path.suffix.lower() in ['.yaml', '.yml']:
-            with open(spec_path, 'r', encoding='utf-8') as f:
-                yaml_content = yaml.safe_load(f)
+        else:
+            converted_etag = spec_etags.get(spec_name)
+            if converted_etag is None:
+                return Response(content=CONVERSION_UNAVAILABLE_BYTES, media_type="application/json", status_code=500)
+
+            compressed = compressed_response(request, converted_etag, "application/json", {
+                "Content-Disposition": f"inline; filename={spec_name}-openapi.json"
+            })
+            if compressed:
+                return compressed
 
-            json_content = json.dumps(yaml_content, indent=2)
+            not_modified = not_modified_response(request, converted_etag)
+            if not_modified:
+                not_modified.headers["Vary"] = "Accept-Encoding"
+                return not_modified
 
             return Response(
-                content=json_content,
+                content=spec_converted_bytes[spec_name],
                 media_type="application/json",
                 headers={
                     "Content-Disposition": f"inline; filename={spec_name}-openapi.json",
-                    "Cache-Control": "public, max-age=3600"
+                    "Cache-Control": "public, max-age=3600",
+                    "ETag": converted_etag,
+                    "Vary": "Accept-Encoding"
                 }
             )
     except Exception as e:
@@ -303,23 +784,26 @@ async def get_spec_json(spec_name: str):
         raise HTTPException(status_code=500, detail=f"Error serving specification: {str(e)}")
 
 @app.get("/{spec_name}/download")
-async def download_spec(spec_name: str):
+async def download_spec(spec_name: str, request: Request):
     """Download the original specification file"""
     if spec_name not in discovered_specs:
-        raise HTTPException(status_code=404, detail=f"Specification '{spec_name}' not found")
-
-    spec_path = discovered_specs[spec_name]
+        return Response(content=NOT_FOUND_BYTES, media_type="application/json", status_code=404)
 
-    if not spec_path.exists():
-        raise HTTPException(status_code=404, detail=f"Specification file not found: {spec_path}")
+    spec_meta = discovered_specs[spec_name]
 
     try:
-        return FileResponse(
-            path=str(spec_path),
+        file_etag = spec_file_etags[spec_name]
+        not_modified = not_modified_response(request, file_etag)
+        if not_modified:
+            return not_modified
+
+        return Response(
+            content=spec_file_bytes[spec_name],
             media_type="application/octet-stream",
             headers={
-                "Content-Disposition": f"attachment; filename={spec_path.name}",
-                "Cache-Control": "public, max-age=3600"
+                "Content-Disposition": f"attachment; filename={spec_meta.name}",
+                "Cache-Control": "public, max-age=3600",
+                "ETag": file_etag
             }
         )
     except Exception as e:
@@ -330,63 +814,53 @@ async def download_spec(spec_name: str):
 async def get_spec_info(spec_name: str):
     """Get information about a specific OpenAPI specification"""
     if spec_name not in discovered_specs:
-        raise HTTPException(status_code=404, detail=f"Specification '{spec_name}' not found")
-
-    spec_path = discovered_specs[spec_name]
+        return Response(content=NOT_FOUND_BYTES, media_type="application/json", status_code=404)
 
-    if not spec_path.exists():
-        raise HTTPException(status_code=404, detail=f"Specification file not found: {spec_path}")
+    # Serve the info payload serialized at startup
+    info_bytes = spec_info_bytes.get(spec_name)
+    if info_bytes is None:
+        return Response(content=INFO_UNAVAILABLE_BYTES, media_type="application/json", status_code=500)
 
-    try:
-        # Load the spec data (handle both JSON and YAML)
-        with open(spec_path, 'r', encoding='utf-8') as f:
-            if spec_path.suffix.lower() == '.json':
-                spec_data = json.load(f)
-            elif spec_path.suffix.lower() in ['.yaml', '.yml']:
-                spec_data = yaml.safe_load(f)
-            else:
-                raise HTTPException(status_code=400, detail=f"Unsupported file type: {spec_path.suffix}")
-
-        # Extract key information
-        info = spec_data.get('info', {})
-        paths = spec_data.get('paths', {})
-        components = spec_data.get('components', {})
-
-        return {
-            "spec_name": spec_name,
-            "title": info.get('title', 'Unknown'),
-            "version": info.get('version', 'Unknown'),
-            "description": info.get('description', ''),
-            "endpoints": len(paths),
-            "endpoint_paths": list(paths.keys()) if len(paths) <= 50 else f"{len(paths)} endpoints (too many to list)",
-            "schemas": len(components.get('schemas', {})),
-            "security_schemes": len(components.get('securitySchemes', {})),
-            "servers": spec_data.get('servers', []),
-            "file_info": {
-                "name": spec_path.name,
-                "path": str(spec_path),
-                "type": spec_path.suffix,
-                "size_bytes": spec_path.stat().st_size,
-                "modified": spec_path.stat().st_mtime
-            },
-            "urls": {
-                "yaml": f"/{spec_name}/openapi.yaml",
-                "json": f"/{spec_name}/openapi.json",
-                "download": f"/{spec_name}/download"
-            }
-        }
-    except Exception as e:
-        logger.error(f"Error reading spec info: {e}")
-        raise HTTPException(status_code=500, detail=f"Error reading specification: {str(e)}")
+    return Response(content=info_bytes, media_type="application/json")
 
 # Initialize specs discovery on startup
 @app.on_event("startup")
 async def startup_event():
-    """Discover specs on server startup"""
-    global discovered_specs
+    """Discover and parse specs on server startup"""
+    global discovered_specs, spec_urls, root_json_bytes, root_etag, specs_json_bytes
     discovered_specs = discover_specs()
+    spec_urls = {spec_name: build_spec_urls(spec_name) for spec_name in discovered_specs}
+    await load_specs(discovered_specs)
+
+    # Files that could not be read at all are not served, so every remaining spec has a file ETag
+    discovered_specs = {spec_name: spec_meta for spec_name, spec_meta in discovered_specs.items() if spec_name in spec_file_etags}
+
+    # The collections and listing only depend on the specs loaded above, so serialize them once
+    root_json_bytes = orjson.dumps(build_collections())
+    root_etag = make_etag(root_json_bytes)
+    compressed_bodies[root_etag] = compress_variants(root_json_bytes)
+    specs_json_bytes = orjson.dumps(build_specifications())
+
+def run_server(dev: bool = False) -> None:
+    """Run the app under uvicorn; shared by this module and run_spec_server.py"""
+    # Production runs one worker per CPU without access logs; dev mode keeps a single
+    # auto-reloading worker instead. Uvicorn's default "auto" loop and HTTP settings
+    # already pick uvloop/httptools when they are installed.
+    uvicorn.run(
+        "spec_server:app",
+        host="0.0.0.0",
+        port=8001,
+        reload=dev,
+        workers=1 if dev else os.cpu_count() or 1,
+        access_log=dev,
+        log_level="info"
+    )
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve OpenAPI specifications")
+    parser.add_argument("--dev", action="store_true", help="Enable auto-reload and access logging for local development")
+    args = parser.parse_args()
+
     # Discover specifications
     logger.info("Discovering OpenAPI specifications...")
     discovered_specs = discover_specs()
@@ -396,8 +870,8 @@ if __name__ == "__main__":
         logger.warning(f"Please add .yaml, .yml, or .json files to: {SPECS_DIR}")
     else:
         logger.info(f"Found {len(discovered_specs)} specifications:")
-        for spec_name, spec_path in discovered_specs.items():
-            logger.info(f"  - {spec_name}: {spec_path.name}")
+        for spec_name, spec_meta in discovered_specs.items():
+            logger.info(f"  - {spec_name}: {spec_meta.name}")
 
     # Run the server
     logger.info("Starting OpenAPI Specification Server...")
@@ -415,10 +889,4 @@ if __name__ == "__main__":
             logger.info(f"  - {spec_name} Download: http://localhost:8001/{spec_name}/download")
             logger.info(f"  - {spec_name} Info: http://localhost:8001/{spec_name}/info")
 
-    uvicorn.run(
-        "spec_server:app",
-        host="0.0.0.0",
-        port=8001,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    run_server(args.dev)
\ No newline at end of file